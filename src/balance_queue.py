@@ -22,6 +22,7 @@ from typing import Union
 
 import config
 import log_config
+import misc
 import transaction as tr
 
 log = log_config.getLogger(__name__)
@@ -29,8 +30,12 @@ log = log_config.getLogger(__name__)
 
 @dataclasses.dataclass
 class BalancedOperation:
+    # Use slots to reduce the memory footprint of the (many) queue items.
+    # Slots do not allow default values for the fields.
+    __slots__ = ("op", "sold")
+
     op: tr.Operation
-    sold: decimal.Decimal = decimal.Decimal()
+    sold: decimal.Decimal
 
     @property
     def not_sold(self) -> decimal.Decimal:
@@ -53,7 +58,7 @@ class BalanceQueue(abc.ABC):
         # transaction. Keep fees, which couldn't be removed directly from the
         # queue and remove them as soon as possible.
         # At the end, all fees should have been paid (removed from the buffer).
-        self.buffer_fee = decimal.Decimal()
+        self.buffer_fee = misc.DECIMAL_ZERO
 
     @abc.abstractmethod
     def _put_(self, bop: BalancedOperation) -> None:
@@ -89,7 +94,7 @@ class BalanceQueue(abc.ABC):
             item (Union[Operation, BalancedOperation])
         """
         if isinstance(item, tr.Operation):
-            item = BalancedOperation(item)
+            item = BalancedOperation(item, misc.DECIMAL_ZERO)
         elif not isinstance(item, BalancedOperation):
             raise TypeError
 
@@ -98,7 +103,7 @@ class BalanceQueue(abc.ABC):
         # Remove fees which couldn't be removed before.
         if self.buffer_fee:
             # Clear the buffer.
-            fee, self.buffer_fee = self.buffer_fee, decimal.Decimal()
+            fee, self.buffer_fee = self.buffer_fee, misc.DECIMAL_ZERO
             # Try to remove the fees.
             self._remove_fee(fee)
 
@@ -131,6 +136,7 @@ class BalanceQueue(abc.ABC):
     def _remove(
         self,
         change: decimal.Decimal,
+        keep_sold_coins: bool = True,
     ) -> tuple[list[tr.SoldCoin], decimal.Decimal]:
         """Remove as many coins as necessary from the queue.
 
@@ -138,6 +144,8 @@ class BalanceQueue(abc.ABC):
 
         Args:
             change (decimal.Decimal): Amount of coins to be removed.
+            keep_sold_coins (bool, optional): Keep track of the removed coins.
+                When False, the returned list is empty. Defaults to True.
 
         Returns:
           - list[tr.SoldCoin]: List of coins which were removed.
@@ -158,9 +166,10 @@ class BalanceQueue(abc.ABC):
                 # Update the sold value,
                 bop.sold += change
                 # keep track of the sold amount
-                sold_coins.append(tr.SoldCoin(bop.op, change))
+                if keep_sold_coins:
+                    sold_coins.append(tr.SoldCoin(bop.op, change))
                 # and set the change to 0.
-                change = decimal.Decimal()
+                change = misc.DECIMAL_ZERO
                 # All demanded change was removed.
                 break
 
@@ -171,7 +180,8 @@ class BalanceQueue(abc.ABC):
                 # remove the fully sold coin from the queue
                 self._pop()
                 # and keep track of the sold amount.
-                sold_coins.append(tr.SoldCoin(bop.op, not_sold))
+                if keep_sold_coins:
+                    sold_coins.append(tr.SoldCoin(bop.op, not_sold))
 
         assert change >= 0, "Removed more than necessary from the queue."
         return sold_coins, change
@@ -179,6 +189,7 @@ class BalanceQueue(abc.ABC):
     def remove(
         self,
         op: tr.Operation,
+        keep_sold_coins: bool = True,
     ) -> list[tr.SoldCoin]:
         """Remove as many coins as necessary from the queue.
 
@@ -186,6 +197,8 @@ class BalanceQueue(abc.ABC):
 
         Args:
             op (tr.Operation): Operation with coins to be removed.
+            keep_sold_coins (bool, optional): Keep track of the removed coins.
+                When False, the returned list is empty. Defaults to True.
 
         Raises:
             RuntimeError: When there are not enough coins in queue to be sold.
@@ -194,7 +207,7 @@ class BalanceQueue(abc.ABC):
           - list[tr.SoldCoin]: List of coins which were removed.
         """
         assert op.coin == self.coin
-        sold_coins, unsold_change = self._remove(op.change)
+        sold_coins, unsold_change = self._remove(op.change, keep_sold_coins)
 
         if unsold_change:
             # Queue ran out of items to sell and not all coins could be sold.
@@ -233,7 +246,7 @@ class BalanceQueue(abc.ABC):
         Args:
             fee: decimal.Decimal
         """
-        _, left_over_fee = self._remove(fee)
+        _, left_over_fee = self._remove(fee, keep_sold_coins=False)
         if left_over_fee and self.coin != config.FIAT:
             log.warning(
                 "Not enough coins in queue to remove fee. Buffer the fee for "
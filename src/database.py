@@ -64,23 +64,71 @@ def __get_price_db(
     Returns:
         Optional[decimal.Decimal]: Price.
     """
+    return __get_prices_db(db_path, tablename, [utc_time])[0]
+
+
+def __get_prices_db(
+    db_path: Path,
+    tablename: str,
+    utc_times: list[datetime.datetime],
+) -> list[Optional[decimal.Decimal]]:
+    """Try to retrieve multiple prices from our local database at once.
+
+    All prices are read with a single database connection.
+
+    Args:
+        db_path (Path)
+        tablename (str)
+        utc_times (list[datetime.datetime])
+
+    Returns:
+        list[Optional[decimal.Decimal]]: Prices in the order of `utc_times`.
+    """
+    prices: list[Optional[decimal.Decimal]] = [None] * len(utc_times)
+
     if db_path.is_file():
         with sqlite3.connect(db_path) as conn:
             cur = conn.cursor()
             query = f"SELECT price FROM `{tablename}` WHERE utc_time=?;"
 
-            try:
-                cur.execute(query, (utc_time,))
-            except sqlite3.OperationalError as e:
-                if str(e) == f"no such table: {tablename}":
-                    return None
-                raise e
+            for idx, utc_time in enumerate(utc_times):
+                try:
+                    cur.execute(query, (utc_time,))
+                except sqlite3.OperationalError as e:
+                    if str(e) == f"no such table: {tablename}":
+                        break
+                    raise e
 
-            if prices := cur.fetchone():
-                price = misc.force_decimal(prices[0])
-                return price
+                if row := cur.fetchone():
+                    prices[idx] = misc.force_decimal(row[0])
+
+    return prices
+
+
+def _prepare_price_db(
+    price: Optional[decimal.Decimal],
+    inverted: bool,
+) -> Optional[decimal.Decimal]:
+    """Prepare a price from our local database to be returned.
+
+    Args:
+        price (Optional[decimal.Decimal]): Price from database.
+        inverted (bool): Is the table name inverted to the requested pair?
+
+    Returns:
+        Optional[decimal.Decimal]: Price.
+    """
+    if price is None:
+        return None
 
-    return None
+    if not price and config.REFETCH_MISSING_PRICES:
+        # Return None instead of price=0, so that our tool refetches the price.
+        return None
+
+    if inverted:
+        price = misc.reciprocal(price)
+
+    return price
 
 
 def get_price_db(
@@ -106,18 +154,33 @@ def get_price_db(
     db_path = get_db_path(platform, db_path)
 
     price = __get_price_db(db_path, tablename, utc_time)
+    return _prepare_price_db(price, inverted)
 
-    if price is None:
-        return None
 
-    if not price and config.REFETCH_MISSING_PRICES:
-        # Return None instead of price=0, so that our tool refetches the price.
-        return None
+def get_prices_db(
+    platform: str,
+    coin: str,
+    reference_coin: str,
+    utc_times: list[datetime.datetime],
+    db_path: Optional[Path] = None,
+) -> list[Optional[decimal.Decimal]]:
+    """Try to retrieve multiple prices from our local database at once.
 
-    if inverted:
-        price = misc.reciprocal(price)
+    Args:
+        platform (str)
+        coin (str)
+        reference_coin (str)
+        utc_times (list[datetime.datetime])
+        db_path (Optional[Path]): Defaults to None.
 
-    return price
+    Returns:
+        list[Optional[decimal.Decimal]]: Prices in the order of `utc_times`.
+    """
+    tablename, inverted = get_sorted_tablename(coin, reference_coin)
+    db_path = get_db_path(platform, db_path)
+
+    prices = __get_prices_db(db_path, tablename, utc_times)
+    return [_prepare_price_db(price, inverted) for price in prices]
 
 
 def __mean_price_db(
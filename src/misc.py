@@ -17,6 +17,7 @@
 import collections
 import datetime
 import decimal
+import operator
 import random
 import re
 import subprocess
@@ -41,6 +42,9 @@ import core
 F = TypeVar("F", bound=Callable[..., Any])
 L = TypeVar("L", bound=list[Any])
 
+# Decimals are immutable, so a single zero instance can be shared.
+DECIMAL_ZERO = decimal.Decimal()
+
 
 def xint(x: Union[None, str, SupportsInt]) -> Optional[int]:
     return None if x is None or x == "" else int(x)
@@ -82,7 +86,7 @@ def cdecimal(x: Union[None, str, int, float, decimal.Decimal]) -> decimal.Decima
         decimal.Decimal
     """
     dec = xdecimal(x)
-    return decimal.Decimal() if dec is None else dec
+    return DECIMAL_ZERO if dec is None else dec
 
 
 def dsum(__iterable: Iterable[decimal.Decimal]) -> decimal.Decimal:
@@ -94,7 +98,9 @@ def dsum(__iterable: Iterable[decimal.Decimal]) -> decimal.Decimal:
     Returns:
         decimal.Decimal
     """
-    return decimal.Decimal(sum(__iterable))
+    # Start the sum with a Decimal. This avoids the int + Decimal addition for
+    # the first element and the final conversion of the result.
+    return sum(__iterable, DECIMAL_ZERO)
 
 
 def force_decimal(x: Union[None, str, int, float, decimal.Decimal]) -> decimal.Decimal:
@@ -119,7 +125,7 @@ def force_decimal(x: Union[None, str, int, float, decimal.Decimal]) -> decimal.D
 
 
 def reciprocal(d: decimal.Decimal) -> decimal.Decimal:
-    return decimal.Decimal() if d == 0 else decimal.Decimal(1) / d
+    return DECIMAL_ZERO if d == 0 else decimal.Decimal(1) / d
 
 
 def to_ms_timestamp(d: datetime.datetime) -> int:
@@ -211,16 +217,22 @@ def group_by(lst: L, key: Union[str, list[str]]) -> dict[Any, L]:
     Returns:
         dict[Any, L]: Dict with different `key`as keys.
     """
-    d = collections.defaultdict(list)
+    get_key: Callable[[Any], Any]
     if isinstance(key, str):
-        for e in lst:
-            d[getattr(e, key)].append(e)
+        get_key = operator.attrgetter(key)
     elif isinstance(key, list):
         assert all(isinstance(k, str) for k in key)
-        for e in lst:
-            d[tuple(getattr(e, k) for k in key)].append(e)
+        if len(key) > 1:
+            # attrgetter returns a tuple when multiple attributes are given.
+            get_key = operator.attrgetter(*key)
+        else:
+            get_key = lambda e: tuple(getattr(e, k) for k in key)  # noqa: E731
     else:
         raise TypeError
+
+    d = collections.defaultdict(list)
+    for e in lst:
+        d[get_key(e)].append(e)
     return dict(d)
 
 
@@ -246,12 +258,17 @@ def sort_by_order_and_key(
         list[T]: Sorted entries by `order` and specific keys.
     """
 
+    # Look up the position of each type once instead of searching the order
+    # list for every entry.
+    order_index: dict[Type[T], int] = {}
+    for idx, type_ in enumerate(order):
+        order_index.setdefault(type_, idx)
+
+    key_names = keys or []
+
     def key_function(op: T) -> tuple:
-        try:
-            idx = order.index(type(op))
-        except ValueError:
-            idx = 0
-        return tuple(([getattr(op, key) for key in keys] if keys else []) + [idx])
+        idx = order_index.get(type(op), 0)
+        return (*(getattr(op, key) for key in key_names), idx)
 
     return sorted(list_, key=key_function)
 
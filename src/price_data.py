@@ -15,13 +15,14 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import bisect
+import collections
 import datetime
 import decimal
 import json
 import sqlite3
 import time
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Iterable, Union
 
 import requests
 
@@ -30,7 +31,13 @@ import log_config
 import misc
 import transaction as tr
 from core import kraken_pair_map
-from database import get_price_db, get_tablenames_from_db, mean_price_db, set_price_db
+from database import (
+    get_price_db,
+    get_prices_db,
+    get_tablenames_from_db,
+    mean_price_db,
+    set_price_db,
+)
 
 log = log_config.getLogger(__name__)
 
@@ -43,6 +50,13 @@ class PriceData:
     # list of Kraken pairs that returned invalid arguments error
     kraken_invalid_pairs: list[str] = []
 
+    def __init__(self) -> None:
+        # Prices which were already read from the database or fetched from a
+        # platform (see `_price_cache_key`).
+        self._price_cache: dict[
+            tuple[str, str, str, datetime.datetime, Any], decimal.Decimal
+        ] = {}
+
     @misc.delayed
     def _get_price_binance(
         self,
@@ -552,6 +566,17 @@ class PriceData:
         )
         return decimal.Decimal()
 
+    @staticmethod
+    def _price_cache_key(
+        platform: str,
+        coin: str,
+        reference_coin: str,
+        utc_time: datetime.datetime,
+    ) -> tuple[str, str, str, datetime.datetime, Any]:
+        # The database stores the datetime with its timezone, so the timezone
+        # has to be part of the key.
+        return (platform, coin, reference_coin, utc_time, utc_time.tzinfo)
+
     def get_price(
         self,
         platform: str,
@@ -564,6 +589,8 @@ class PriceData:
         The function tries to retrieve the price from the local database first.
         If the price does not exist, its gathered from a platform specific
         function and saved to our local database for future access.
+        Retrieved prices are cached in memory, so that repeated requests for the
+        same price (e.g. partial sells of the same coins) skip the database.
         Args:
             platform (str)
             coin (str)
@@ -578,17 +605,22 @@ class PriceData:
         if coin == reference_coin:
             return decimal.Decimal("1")
 
-        # Check if price exists already in our database.
-        if (price := get_price_db(platform, coin, reference_coin, utc_time)) is None:
-            # Price doesn't exists. Fetch price from platform.
-            try:
-                get_price = getattr(self, f"_get_price_{platform}")
-            except AttributeError:
-                raise NotImplementedError(f"Unable to read data from {platform=}")
+        key = self._price_cache_key(platform, coin, reference_coin, utc_time)
+        if (price := self._price_cache.get(key)) is None:
+            # Check if price exists already in our database.
+            if (
+                price := get_price_db(platform, coin, reference_coin, utc_time)
+            ) is None:
+                # Price doesn't exists. Fetch price from platform.
+                try:
+                    get_price = getattr(self, f"_get_price_{platform}")
+                except AttributeError:
+                    raise NotImplementedError(f"Unable to read data from {platform=}")
 
-            price = get_price(coin, utc_time, reference_coin, **kwargs)
-            assert isinstance(price, decimal.Decimal)
-            set_price_db(platform, coin, reference_coin, utc_time, price)
+                price = get_price(coin, utc_time, reference_coin, **kwargs)
+                assert isinstance(price, decimal.Decimal)
+                set_price_db(platform, coin, reference_coin, utc_time, price)
+            self._price_cache[key] = price
 
         if config.MEAN_MISSING_PRICES and price <= 0.0:
             # The price is missing. Check for prices before and after the
@@ -598,18 +630,60 @@ class PriceData:
 
         return price
 
+    def prefetch_prices(
+        self,
+        operations: Iterable[tr.Operation],
+        reference_coin: str = config.FIAT,
+    ) -> None:
+        """Read the prices of multiple operations from the local database.
+
+        The prices are read with one database connection per platform and
+        coin and are cached for subsequent calls of `get_price`.
+        Missing prices are not fetched. They will be fetched when they are
+        requested by `get_price`.
+
+        Args:
+            operations (Iterable[tr.Operation])
+            reference_coin (str, optional): Defaults to config.FIAT.
+        """
+        utc_times: dict[
+            tuple[str, str], list[datetime.datetime]
+        ] = collections.defaultdict(list)
+        requested = set()
+        for op in operations:
+            key = self._price_cache_key(
+                op.platform, op.coin, reference_coin, op.utc_time
+            )
+            if (
+                op.coin != reference_coin
+                and key not in self._price_cache
+                and key not in requested
+            ):
+                requested.add(key)
+                utc_times[(op.platform, op.coin)].append(op.utc_time)
+
+        for (platform, coin), times in utc_times.items():
+            prices = get_prices_db(platform, coin, reference_coin, times)
+            for utc_time, price in zip(times, prices):
+                if price is not None:
+                    key = self._price_cache_key(
+                        platform, coin, reference_coin, utc_time
+                    )
+                    self._price_cache[key] = price
+
     def get_cost(
         self,
         op_sc: Union[tr.Operation, tr.SoldCoin],
         reference_coin: str = config.FIAT,
     ) -> decimal.Decimal:
-        op = op_sc if isinstance(op_sc, tr.Operation) else op_sc.op
-        price = self.get_price(op.platform, op.coin, op.utc_time, reference_coin)
         if isinstance(op_sc, tr.Operation):
-            return price * op_sc.change
-        if isinstance(op_sc, tr.SoldCoin):
-            return price * op_sc.sold
-        raise NotImplementedError
+            op, amount = op_sc, op_sc.change
+        elif isinstance(op_sc, tr.SoldCoin):
+            op, amount = op_sc.op, op_sc.sold
+        else:
+            raise NotImplementedError
+        price = self.get_price(op.platform, op.coin, op.utc_time, reference_coin)
+        return price * amount
 
     def get_partial_cost(
         self,
@@ -18,8 +18,9 @@ import collections
 import dataclasses
 import datetime
 import decimal
+import functools
 from pathlib import Path
-from typing import Any, Optional, Type, Union
+from typing import Any, Callable, Iterator, Optional, Type, Union
 
 import xlsxwriter
 from dateutil.relativedelta import relativedelta
@@ -43,11 +44,61 @@ TAX_DEADLINE = min(
     ),  # end of year
 )
 
+# Margin around the one year boundary, in which the exact calculation
+# is required (see `sold_within_one_year`).
+ONE_YEAR_BOUNDARY_MARGIN = datetime.timedelta(days=2)
+
+# Decimal context of the tax evaluation. The precision is kept at the
+# default of 28 digits because coins like ETH have up to 18 decimal places.
+# The context is installed once for the whole evaluation instead of relying
+# on the (thread-local) default context of the caller.
+# Amounts, prices and fiat values are kept as Decimal on purpose. Scaled
+# integers would need one fixed scale for all of them, while prices of small
+# coins need more decimal places than any fixed scale for fiat values, and
+# every partial sell (a division) would be truncated to that scale.
+DECIMAL_CONTEXT = decimal.Context(
+    prec=28,
+    rounding=decimal.ROUND_HALF_EVEN,
+    traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+)
+
 
 def in_tax_year(op: tr.Operation) -> bool:
     return op.utc_time.year == config.TAX_YEAR
 
 
+@functools.lru_cache(maxsize=128)
+def _one_year_before(utc_time: datetime.datetime) -> datetime.datetime:
+    return utc_time - relativedelta(years=1)
+
+
+def sold_within_one_year(
+    buy_utc_time: datetime.datetime,
+    sell_utc_time: datetime.datetime,
+) -> bool:
+    """Check if coins were sold not more than one year after they were bought.
+
+    Equal to `buy_utc_time + relativedelta(years=1) >= sell_utc_time`.
+    The one year boundary is calculated once per sell time. Comparing with
+    the boundary only differs from the exact calculation around leap days
+    (and timezone shifts), so the exact calculation is only done for buys
+    close to the boundary.
+
+    Args:
+        buy_utc_time (datetime.datetime)
+        sell_utc_time (datetime.datetime)
+
+    Returns:
+        bool: True if the sell is within one year after the buy.
+    """
+    boundary = _one_year_before(sell_utc_time)
+    if buy_utc_time > boundary + ONE_YEAR_BOUNDARY_MARGIN:
+        return True
+    if buy_utc_time < boundary - ONE_YEAR_BOUNDARY_MARGIN:
+        return False
+    return buy_utc_time + relativedelta(years=1) >= sell_utc_time
+
+
 class Taxman:
     def __init__(self, book: Book, price_data: PriceData) -> None:
         self.book = book
@@ -69,6 +120,24 @@ class Taxman:
         except AttributeError:
             raise NotImplementedError(f"Unable to evaluate taxation for {country=}.")
 
+        # Map the operation types to their country specific evaluation function.
+        self._operation_evaluators_GERMANY: dict[
+            Type[tr.Operation], Callable[[Any], None]
+        ] = {
+            tr.CoinLend: self._evaluate_lend_or_stake_GERMANY,
+            tr.Staking: self._evaluate_lend_or_stake_GERMANY,
+            tr.CoinLendEnd: self._evaluate_lend_or_stake_end_GERMANY,
+            tr.StakingEnd: self._evaluate_lend_or_stake_end_GERMANY,
+            tr.Buy: self._evaluate_buy_GERMANY,
+            tr.Sell: self._evaluate_sell_GERMANY,
+            tr.CoinLendInterest: self._evaluate_interest_GERMANY,
+            tr.StakingInterest: self._evaluate_interest_GERMANY,
+            tr.Airdrop: self._evaluate_airdrop_GERMANY,
+            tr.Commission: self._evaluate_commission_GERMANY,
+            tr.Deposit: self._evaluate_deposit_GERMANY,
+            tr.Withdrawal: self._evaluate_withdrawal_GERMANY,
+        }
+
         # Determine the BalanceType.
         if config.PRINCIPLE == core.Principle.FIFO:
             # Explicity define type for BalanceType on first declaration
@@ -84,13 +153,20 @@ class Taxman:
             )
 
         self._balances: dict[Any, balance_queue.BalanceQueue] = {}
+        # config.MULTI_DEPOT does not change during a run. Decide once how the
+        # balances are keyed instead of checking the config for every operation.
+        self._balance_key: Callable[[str, str], Any] = (
+            (lambda platform, coin: (platform, coin))
+            if config.MULTI_DEPOT
+            else (lambda platform, coin: coin)
+        )
 
     ###########################################################################
     # Helper functions for balances
     ###########################################################################
 
     def balance(self, platform: str, coin: str) -> balance_queue.BalanceQueue:
-        key = (platform, coin) if config.MULTI_DEPOT else coin
+        key = self._balance_key(platform, coin)
         try:
             return self._balances[key]
         except KeyError:
@@ -104,8 +180,10 @@ class Taxman:
     def add_to_balance(self, op: tr.Operation) -> None:
         self.balance_op(op).add(op)
 
-    def remove_from_balance(self, op: tr.Operation) -> list[tr.SoldCoin]:
-        return self.balance_op(op).remove(op)
+    def remove_from_balance(
+        self, op: tr.Operation, keep_sold_coins: bool = True
+    ) -> list[tr.SoldCoin]:
+        return self.balance_op(op).remove(op, keep_sold_coins)
 
     def remove_fees_from_balance(self, fees: Optional[list[tr.Fee]]) -> None:
         if fees is not None:
@@ -144,7 +222,7 @@ class Taxman:
         percent = sc.sold / sc.op.change
 
         # Fees paid when buying the now sold coins.
-        buying_fees = decimal.Decimal()
+        buying_fees = misc.DECIMAL_ZERO
         if sc.op.fees:
             buying_fees = misc.dsum(
                 self.price_data.get_partial_cost(f, percent) for f in sc.op.fees
@@ -181,18 +259,37 @@ class Taxman:
 
         return buy_value + buying_fees
 
+    def get_total_sell_value(self, op: tr.Sell) -> decimal.Decimal:
+        """Calculate the sell value of the whole sell operation by determining
+        the market price for the with that sell bought coins.
+
+        Args:
+            op (tr.Sell): The sell operation.
+
+        Returns:
+            decimal.Decimal: The sell value of `op.change`.
+        """
+        if op.selling_value:
+            return op.selling_value
+        if op.link:
+            return self.price_data.get_cost(op.link)
+        return self.price_data.get_cost(op)
+
     def get_sell_value(
         self,
         op: tr.Sell,
         sc: tr.SoldCoin,
+        total_sell_value: Optional[decimal.Decimal] = None,
     ) -> decimal.Decimal:
-        """Calculate the sell value by determining the market price for the
-        with that sell bought coins.
+        """Calculate the sell value of a sold coin proportionally to the
+        sell value of the whole sell operation.
 
         Args:
+            op (tr.Sell): The sell operation.
             sc (tr.SoldCoin): The sold coin.
-            ReportType (Union[Type[tr.SellReportEntry],
-                Type[tr.UnrealizedSellReportEntry]])
+            total_sell_value (Optional[decimal.Decimal], optional):
+                Sell value of the whole sell operation. Will be determined
+                when not given. Defaults to None.
 
         Returns:
             decimal.Decimal: The sell value.
@@ -200,24 +297,20 @@ class Taxman:
         assert sc.op.coin == op.coin
         percent = sc.sold / op.change
 
-        if op.selling_value:
-            sell_value = op.selling_value * percent
-        elif op.link:
-            sell_value = self.price_data.get_partial_cost(op.link, percent)
-        else:
-            sell_value = self.price_data.get_partial_cost(op, percent)
+        if total_sell_value is None:
+            total_sell_value = self.get_total_sell_value(op)
 
-        return sell_value
+        return total_sell_value * percent
 
     def _get_fee_param_dict(self, op: tr.Operation, percent: decimal.Decimal) -> dict:
 
         # fee amount/coin/in_fiat
-        first_fee_amount = decimal.Decimal(0)
+        first_fee_amount = misc.DECIMAL_ZERO
         first_fee_coin = ""
-        first_fee_in_fiat = decimal.Decimal(0)
-        second_fee_amount = decimal.Decimal(0)
+        first_fee_in_fiat = misc.DECIMAL_ZERO
+        second_fee_amount = misc.DECIMAL_ZERO
         second_fee_coin = ""
-        second_fee_in_fiat = decimal.Decimal(0)
+        second_fee_in_fiat = misc.DECIMAL_ZERO
         if op.fees is None or len(op.fees) == 0:
             pass
         elif len(op.fees) >= 1:
@@ -247,6 +340,7 @@ class Taxman:
         ReportType: Union[
             Type[tr.SellReportEntry], Type[tr.UnrealizedSellReportEntry]
         ] = tr.SellReportEntry,
+        total_sell_value: Optional[decimal.Decimal] = None,
     ) -> None:
         """Evaluate a (partial) sell operation.
 
@@ -257,6 +351,9 @@ class Taxman:
             ReportType (Union[Type[tr.SellReportEntry],
                 Type[tr.UnrealizedSellReportEntry]], optional):
                 The type of the report entry. Defaults to tr.SellReportEntry.
+            total_sell_value (Optional[decimal.Decimal], optional):
+                Sell value of the whole sell operation. Will be determined
+                when not given. Defaults to None.
 
         Raises:
             NotImplementedError: When there are more than two different fee coins.
@@ -277,10 +374,10 @@ class Taxman:
         buy_cost_in_fiat = self.get_buy_cost(sc)
 
         # Taxable when sell is not more than one year after buy.
-        is_taxable = sc.op.utc_time + relativedelta(years=1) >= op.utc_time
+        is_taxable = sold_within_one_year(sc.op.utc_time, op.utc_time)
 
         try:
-            sell_value_in_fiat = self.get_sell_value(op, sc)
+            sell_value_in_fiat = self.get_sell_value(op, sc, total_sell_value)
         except Exception as e:
             if ReportType is tr.UnrealizedSellReportEntry:
                 log.warning(
@@ -296,7 +393,7 @@ class Taxman:
                     "be exported.\n"
                     f"Catched exception: {e}"
                 )
-                sell_value_in_fiat = decimal.Decimal()
+                sell_value_in_fiat = misc.DECIMAL_ZERO
                 self.unrealized_sells_faulty = True
             else:
                 raise e
@@ -327,6 +424,10 @@ class Taxman:
         assert in_tax_year(op)
         assert op.change == misc.dsum(sc.sold for sc in sold_coins)
 
+        # Determine the sell value once for the whole sell. The sell value of
+        # each sold coin is a share of it.
+        total_sell_value = self.get_total_sell_value(op)
+
         for sc in sold_coins:
 
             if isinstance(sc.op, tr.Deposit) and sc.op.link:
@@ -361,7 +462,7 @@ class Taxman:
                         #     * wsc_deposit_fee
                         # )
 
-                    self._evaluate_sell(op, wsc)
+                    self._evaluate_sell(op, wsc, total_sell_value=total_sell_value)
 
             else:
 
@@ -378,205 +479,220 @@ class Taxman:
                         "the sell is not tax relevant and everything is fine."
                     )
 
-                self._evaluate_sell(op, sc)
+                self._evaluate_sell(op, sc, total_sell_value=total_sell_value)
 
     def _evaluate_taxation_GERMANY(self, op: tr.Operation) -> None:
-        report_entry: tr.TaxReportEntry
-
-        if isinstance(op, (tr.CoinLend, tr.Staking)):
-            # TODO determine which coins get lended/etc., use fifo if it's
-            # unclear. it might be worth to optimize the order
-            # of coins given away (is this legal?)
-            # TODO mark them as currently lended/etc., so they don't get sold
-            pass
-
-        elif isinstance(op, (tr.CoinLendEnd, tr.StakingEnd)):
-            # TODO determine which coins come back from lending/etc. use fifo
-            # if it's unclear; it might be nice to match start and
-            # end of these operations like deposit and withdrawal operations.
-            # e.g.
-            # - lending 1 coin for 2 months
-            # - lending 2 coins for 1 month
-            # - getting back 2 coins from lending
-            # --> this should be the second and third coin,
-            #     not the first and second
-            # TODO mark them as not lended/etc. anymore, so they could be sold
-            # again
-            # TODO Add Lending/Staking TaxReportEntry (duration of lend)
-            # TODO maybe add total accumulated fees?
-            #      might be impossible to match CoinInterest with CoinLend periods
-            pass
+        # Dispatch by exact operation type. A single dict lookup is cheaper
+        # than walking through a chain of isinstance checks for every operation.
+        try:
+            evaluate_operation = self._operation_evaluators_GERMANY[type(op)]
+        except KeyError:
+            raise NotImplementedError
+        evaluate_operation(op)
 
-        elif isinstance(op, tr.Buy):
-            # Buys and sells always come in a pair. The buying/receiving
-            # part is not tax relevant per se.
-            # The fees of this buy/sell-transaction are saved internally in
-            # both operations. The "buying fees" are only relevant when
-            # detemining the acquisition cost of the bought coins.
-            # For now we'll just add our bought coins to the balance.
-            self.add_to_balance(op)
-
-            # TODO Only adding the Buys don't bring that much. We should add
-            # all trades instead (buy with buy.link)
-            # Add to export for informational purpose.
-            # if in_tax_year(op):
-            #     fee_params = self._get_fee_param_dict(op, decimal.Decimal(1))
-            #     tax_report_entry = tr.BuyReportEntry(
-            #         platform=op.platform,
-            #         amount=op.change,
-            #         coin=op.coin,
-            #         utc_time=op.utc_time,
-            #         **fee_params,
-            #         buy_value_in_fiat=self.price_data.get_cost(op),
-            #         remark=op.remark,
-            #     )
-            #     self.tax_report_entries.append(tax_report_entry)
-
-        elif isinstance(op, tr.Sell):
-            # Buys and sells always come in a pair. The selling/redeeming
-            # time is tax relevant.
-            # Remove the sold coins and paid fees from the balance.
-            # Evaluate the sell to determine the taxed gain and other relevant
-            # informations for the tax declaration.
-            sold_coins = self.remove_from_balance(op)
-            self.remove_fees_from_balance(op.fees)
-
-            if op.coin != config.FIAT and in_tax_year(op):
-                self.evaluate_sell(op, sold_coins)
-
-        elif isinstance(op, (tr.CoinLendInterest, tr.StakingInterest)):
-            # Received coins from lending or staking. Add the received coins
-            # to the balance.
-            self.add_to_balance(op)
-
-            if in_tax_year(op):
-                # Determine the taxation type depending on the received coin.
-                if isinstance(op, tr.CoinLendInterest):
-                    if misc.is_fiat(op.coin):
-                        ReportType = tr.InterestReportEntry
-                        taxation_type = "Einkünfte aus Kapitalvermögen"
-                    else:
-                        ReportType = tr.LendingInterestReportEntry
-                        taxation_type = "Einkünfte aus sonstigen Leistungen"
-                elif isinstance(op, tr.StakingInterest):
-                    ReportType = tr.StakingInterestReportEntry
-                    taxation_type = "Einkünfte aus sonstigen Leistungen"
+    def _evaluate_lend_or_stake_GERMANY(
+        self, op: Union[tr.CoinLend, tr.Staking]
+    ) -> None:
+        # TODO determine which coins get lended/etc., use fifo if it's
+        # unclear. it might be worth to optimize the order
+        # of coins given away (is this legal?)
+        # TODO mark them as currently lended/etc., so they don't get sold
+        pass
+
+    def _evaluate_lend_or_stake_end_GERMANY(
+        self, op: Union[tr.CoinLendEnd, tr.StakingEnd]
+    ) -> None:
+        # TODO determine which coins come back from lending/etc. use fifo
+        # if it's unclear; it might be nice to match start and
+        # end of these operations like deposit and withdrawal operations.
+        # e.g.
+        # - lending 1 coin for 2 months
+        # - lending 2 coins for 1 month
+        # - getting back 2 coins from lending
+        # --> this should be the second and third coin,
+        #     not the first and second
+        # TODO mark them as not lended/etc. anymore, so they could be sold
+        # again
+        # TODO Add Lending/Staking TaxReportEntry (duration of lend)
+        # TODO maybe add total accumulated fees?
+        #      might be impossible to match CoinInterest with CoinLend periods
+        pass
+
+    def _evaluate_buy_GERMANY(self, op: tr.Buy) -> None:
+        # Buys and sells always come in a pair. The buying/receiving
+        # part is not tax relevant per se.
+        # The fees of this buy/sell-transaction are saved internally in
+        # both operations. The "buying fees" are only relevant when
+        # detemining the acquisition cost of the bought coins.
+        # For now we'll just add our bought coins to the balance.
+        self.add_to_balance(op)
+
+        # TODO Only adding the Buys don't bring that much. We should add
+        # all trades instead (buy with buy.link)
+        # Add to export for informational purpose.
+        # if in_tax_year(op):
+        #     fee_params = self._get_fee_param_dict(op, decimal.Decimal(1))
+        #     tax_report_entry = tr.BuyReportEntry(
+        #         platform=op.platform,
+        #         amount=op.change,
+        #         coin=op.coin,
+        #         utc_time=op.utc_time,
+        #         **fee_params,
+        #         buy_value_in_fiat=self.price_data.get_cost(op),
+        #         remark=op.remark,
+        #     )
+        #     self.tax_report_entries.append(tax_report_entry)
+
+    def _evaluate_sell_GERMANY(self, op: tr.Sell) -> None:
+        # Buys and sells always come in a pair. The selling/redeeming
+        # time is tax relevant.
+        # Remove the sold coins and paid fees from the balance.
+        # Evaluate the sell to determine the taxed gain and other relevant
+        # informations for the tax declaration.
+        # Selling fiat is not taxable and sells before the tax year are not
+        # part of the evaluation. Their balance has to be updated anyway
+        # (e.g. for the portfolio at deadline), but there is no need to keep
+        # track of the sold coins.
+        is_evaluated = op.coin != config.FIAT and in_tax_year(op)
+        sold_coins = self.remove_from_balance(op, keep_sold_coins=is_evaluated)
+        self.remove_fees_from_balance(op.fees)
+
+        if is_evaluated:
+            self.evaluate_sell(op, sold_coins)
+
+    def _evaluate_interest_GERMANY(
+        self, op: Union[tr.CoinLendInterest, tr.StakingInterest]
+    ) -> None:
+        # Received coins from lending or staking. Add the received coins
+        # to the balance.
+        self.add_to_balance(op)
+
+        if in_tax_year(op):
+            # Determine the taxation type depending on the received coin.
+            if isinstance(op, tr.CoinLendInterest):
+                if misc.is_fiat(op.coin):
+                    ReportType = tr.InterestReportEntry
+                    taxation_type = "Einkünfte aus Kapitalvermögen"
                 else:
-                    raise NotImplementedError
-
-                report_entry = ReportType(
-                    platform=op.platform,
-                    amount=op.change,
-                    coin=op.coin,
-                    utc_time=op.utc_time,
-                    interest_in_fiat=self.price_data.get_cost(op),
-                    taxation_type=taxation_type,
-                    remark=op.remark,
-                )
-                self.tax_report_entries.append(report_entry)
+                    ReportType = tr.LendingInterestReportEntry
+                    taxation_type = "Einkünfte aus sonstigen Leistungen"
+            elif isinstance(op, tr.StakingInterest):
+                ReportType = tr.StakingInterestReportEntry
+                taxation_type = "Einkünfte aus sonstigen Leistungen"
+            else:
+                raise NotImplementedError
+
+            report_entry = ReportType(
+                platform=op.platform,
+                amount=op.change,
+                coin=op.coin,
+                utc_time=op.utc_time,
+                interest_in_fiat=self.price_data.get_cost(op),
+                taxation_type=taxation_type,
+                remark=op.remark,
+            )
+            self.tax_report_entries.append(report_entry)
 
-        elif isinstance(op, tr.Airdrop):
-            # Depending on how you received the coins, the taxation varies.
-            # If you didn't "do anything" to get the coins, the airdrop counts
-            # as a gift.
-            self.add_to_balance(op)
+    def _evaluate_airdrop_GERMANY(self, op: tr.Airdrop) -> None:
+        # Depending on how you received the coins, the taxation varies.
+        # If you didn't "do anything" to get the coins, the airdrop counts
+        # as a gift.
+        self.add_to_balance(op)
 
-            if in_tax_year(op):
-                if config.ALL_AIRDROPS_ARE_GIFTS:
-                    taxation_type = "Schenkung"
-                else:
-                    taxation_type = "Einkünfte aus sonstigen Leistungen"
-                report_entry = tr.AirdropReportEntry(
-                    platform=op.platform,
-                    amount=op.change,
-                    coin=op.coin,
-                    utc_time=op.utc_time,
-                    in_fiat=self.price_data.get_cost(op),
-                    taxation_type=taxation_type,
-                    remark=op.remark,
-                )
-                self.tax_report_entries.append(report_entry)
+        if in_tax_year(op):
+            if config.ALL_AIRDROPS_ARE_GIFTS:
+                taxation_type = "Schenkung"
+            else:
+                taxation_type = "Einkünfte aus sonstigen Leistungen"
+            report_entry = tr.AirdropReportEntry(
+                platform=op.platform,
+                amount=op.change,
+                coin=op.coin,
+                utc_time=op.utc_time,
+                in_fiat=self.price_data.get_cost(op),
+                taxation_type=taxation_type,
+                remark=op.remark,
+            )
+            self.tax_report_entries.append(report_entry)
+
+    def _evaluate_commission_GERMANY(self, op: tr.Commission) -> None:
+        # You received a commission. It is assumed that his is a customer-
+        # recruit-customer-bonus which is taxed as `Einkünfte aus sonstigen
+        # Leistungen`.
+        self.add_to_balance(op)
+
+        if in_tax_year(op):
+            report_entry = tr.CommissionReportEntry(
+                platform=op.platform,
+                amount=op.change,
+                coin=op.coin,
+                utc_time=op.utc_time,
+                in_fiat=self.price_data.get_cost(op),
+                taxation_type="Einkünfte aus sonstigen Leistungen",
+                remark=op.remark,
+            )
+            self.tax_report_entries.append(report_entry)
 
-        elif isinstance(op, tr.Commission):
-            # You received a commission. It is assumed that his is a customer-
-            # recruit-customer-bonus which is taxed as `Einkünfte aus sonstigen
-            # Leistungen`.
-            self.add_to_balance(op)
+    def _evaluate_deposit_GERMANY(self, op: tr.Deposit) -> None:
+        # Coins get deposited onto this platform/balance.
+        self.add_to_balance(op)
 
-            if in_tax_year(op):
-                report_entry = tr.CommissionReportEntry(
-                    platform=op.platform,
+        if in_tax_year(op):
+            report_entry: tr.TaxReportEntry
+            if op.link:
+                assert op.coin == op.link.coin
+                assert op.fees is None
+                first_fee_amount = op.link.change - op.change
+                first_fee_coin = op.coin if first_fee_amount else ""
+                first_fee_in_fiat = (
+                    self.price_data.get_price(op.platform, op.coin, op.utc_time)
+                    if first_fee_amount
+                    else misc.DECIMAL_ZERO
+                )
+                report_entry = tr.TransferReportEntry(
+                    first_platform=op.platform,
+                    second_platform=op.link.platform,
                     amount=op.change,
                     coin=op.coin,
-                    utc_time=op.utc_time,
-                    in_fiat=self.price_data.get_cost(op),
-                    taxation_type="Einkünfte aus sonstigen Leistungen",
+                    first_utc_time=op.utc_time,
+                    second_utc_time=op.link.utc_time,
+                    first_fee_amount=first_fee_amount,
+                    first_fee_coin=first_fee_coin,
+                    first_fee_in_fiat=first_fee_in_fiat,
                     remark=op.remark,
                 )
-                self.tax_report_entries.append(report_entry)
-
-        elif isinstance(op, tr.Deposit):
-            # Coins get deposited onto this platform/balance.
-            self.add_to_balance(op)
-
-            if in_tax_year(op):
-                if op.link:
-                    assert op.coin == op.link.coin
-                    assert op.fees is None
-                    first_fee_amount = op.link.change - op.change
-                    first_fee_coin = op.coin if first_fee_amount else ""
-                    first_fee_in_fiat = (
-                        self.price_data.get_price(op.platform, op.coin, op.utc_time)
-                        if first_fee_amount
-                        else decimal.Decimal()
-                    )
-                    report_entry = tr.TransferReportEntry(
-                        first_platform=op.platform,
-                        second_platform=op.link.platform,
-                        amount=op.change,
-                        coin=op.coin,
-                        first_utc_time=op.utc_time,
-                        second_utc_time=op.link.utc_time,
-                        first_fee_amount=first_fee_amount,
-                        first_fee_coin=first_fee_coin,
-                        first_fee_in_fiat=first_fee_in_fiat,
-                        remark=op.remark,
-                    )
-                else:
-                    assert op.fees is None
-                    report_entry = tr.DepositReportEntry(
-                        platform=op.platform,
-                        amount=op.change,
-                        coin=op.coin,
-                        utc_time=op.utc_time,
-                        first_fee_amount=decimal.Decimal(),
-                        first_fee_coin="",
-                        first_fee_in_fiat=decimal.Decimal(),
-                        remark=op.remark,
-                    )
-                self.tax_report_entries.append(report_entry)
-
-        elif isinstance(op, tr.Withdrawal):
-            # Coins get moved to somewhere else. At this point, we only have
-            # to remove them from the corresponding balance.
-            op.withdrawn_coins = self.remove_from_balance(op)
-
-            if not op.has_link and in_tax_year(op):
+            else:
                 assert op.fees is None
-                report_entry = tr.WithdrawalReportEntry(
+                report_entry = tr.DepositReportEntry(
                     platform=op.platform,
                     amount=op.change,
                     coin=op.coin,
                     utc_time=op.utc_time,
-                    first_fee_amount=decimal.Decimal(),
+                    first_fee_amount=misc.DECIMAL_ZERO,
                     first_fee_coin="",
-                    first_fee_in_fiat=decimal.Decimal(),
+                    first_fee_in_fiat=misc.DECIMAL_ZERO,
                     remark=op.remark,
                 )
-                self.tax_report_entries.append(report_entry)
-
-        else:
-            raise NotImplementedError
+            self.tax_report_entries.append(report_entry)
+
+    def _evaluate_withdrawal_GERMANY(self, op: tr.Withdrawal) -> None:
+        # Coins get moved to somewhere else. At this point, we only have
+        # to remove them from the corresponding balance.
+        op.withdrawn_coins = self.remove_from_balance(op)
+
+        if not op.has_link and in_tax_year(op):
+            assert op.fees is None
+            report_entry = tr.WithdrawalReportEntry(
+                platform=op.platform,
+                amount=op.change,
+                coin=op.coin,
+                utc_time=op.utc_time,
+                first_fee_amount=misc.DECIMAL_ZERO,
+                first_fee_coin="",
+                first_fee_in_fiat=misc.DECIMAL_ZERO,
+                remark=op.remark,
+            )
+            self.tax_report_entries.append(report_entry)
 
     def _evaluate_unrealized_sells(self) -> None:
         """Evaluate the unrealized sells at taxation deadline."""
@@ -613,6 +729,40 @@ class Taxman:
     # General tax evaluation functions.
     ###########################################################################
 
+    def _get_priced_operations(
+        self, operations: list[tr.Operation]
+    ) -> Iterator[tr.Operation]:
+        """Yield the operations whose prices are required to evaluate the
+        tax year.
+
+        These are the taxed operations of the tax year, their fees and the
+        bought coins of the sell trades. Prices of older operations (e.g. to
+        determine the buy cost of sold coins) are only read on demand.
+
+        Args:
+            operations (list[tr.Operation])
+
+        Yields:
+            tr.Operation
+        """
+        for op in operations:
+            if not in_tax_year(op):
+                continue
+            if isinstance(op, tr.Sell):
+                if op.coin == config.FIAT:
+                    continue
+                if not op.selling_value:
+                    yield op.link if op.link else op
+            elif isinstance(
+                op,
+                (tr.CoinLendInterest, tr.StakingInterest, tr.Airdrop, tr.Commission),
+            ):
+                yield op
+            else:
+                continue
+            if op.fees:
+                yield from op.fees
+
     def evaluate_taxation(self) -> None:
         """Evaluate the taxation using country specific functions."""
         log.debug("Starting evaluation...")
@@ -624,20 +774,30 @@ class Taxman:
         # Sort the operations by time.
         operations = tr.sort_operations(self.book.operations, ["utc_time"])
 
-        # Evaluate the operations one by one.
-        # Difference between the config.MULTI_DEPOT and "single depot" method
-        # is done by keeping balances per platform and coin or only
-        # per coin (see self.balance).
-        for operation in operations:
-            self.__evaluate_taxation(operation)
-
-        # Make sure, that all fees were paid.
-        for balance in self._balances.values():
-            balance.sanity_check()
-
-        # Evaluate the balance at deadline to calculate unrealized sells.
-        if config.CALCULATE_UNREALIZED_GAINS:
-            self._evaluate_unrealized_sells()
+        # Read the prices required for the tax year from the database at once,
+        # instead of opening the database for every single price.
+        self.price_data.prefetch_prices(self._get_priced_operations(operations))
+
+        with decimal.localcontext(DECIMAL_CONTEXT):
+            # Evaluate the operations one by one.
+            # Difference between the config.MULTI_DEPOT and "single depot"
+            # method is done by keeping balances per platform and coin or only
+            # per coin (see self.balance).
+            # The operations can not be evaluated per coin (or in parallel),
+            # because the fees of an operation might be paid with another
+            # coin and have to be removed from that balance in chronological
+            # order. Prices are also fetched from rate limited APIs and cached
+            # in shared sqlite databases.
+            for operation in operations:
+                self.__evaluate_taxation(operation)
+
+            # Make sure, that all fees were paid.
+            for balance in self._balances.values():
+                balance.sanity_check()
+
+            # Evaluate the balance at deadline to calculate unrealized sells.
+            if config.CALCULATE_UNREALIZED_GAINS:
+                self._evaluate_unrealized_sells()
 
     ###########################################################################
     # Export / Summary
@@ -649,30 +809,25 @@ class Taxman:
             f"Your tax evaluation for {config.TAX_YEAR} "
             f"(Deadline {TAX_DEADLINE.strftime('%d.%m.%Y')}):\n\n"
         )
-        for taxation_type, tax_report_entries in misc.group_by(
-            self.tax_report_entries, "taxation_type"
-        ).items():
-            if taxation_type is None:
+        # Sum up all gains in a single pass over the report entries.
+        taxable_gains: dict[str, decimal.Decimal] = {}
+        unrealized_gain = unrealized_taxable_gain = misc.DECIMAL_ZERO
+        for tre in self.tax_report_entries:
+            if tre.taxation_type is None:
                 continue
-            taxable_gain = misc.dsum(
-                tre.taxable_gain_in_fiat
-                for tre in tax_report_entries
-                if not isinstance(tre, tr.UnrealizedSellReportEntry)
+            taxable_gain = taxable_gains.setdefault(
+                tre.taxation_type, misc.DECIMAL_ZERO
             )
-            eval_str += f"{taxation_type}: {taxable_gain:.2f} {config.FIAT}\n"
+            if isinstance(tre, tr.UnrealizedSellReportEntry):
+                unrealized_gain += misc.not_none(tre.gain_in_fiat)
+                unrealized_taxable_gain += tre.taxable_gain_in_fiat
+            else:
+                taxable_gains[tre.taxation_type] = (
+                    taxable_gain + tre.taxable_gain_in_fiat
+                )
 
-        unrealized_report_entries = [
-            tre
-            for tre in self.tax_report_entries
-            if isinstance(tre, tr.UnrealizedSellReportEntry)
-        ]
-        assert all(tre.gain_in_fiat is not None for tre in unrealized_report_entries)
-        unrealized_gain = misc.dsum(
-            misc.not_none(tre.gain_in_fiat) for tre in unrealized_report_entries
-        )
-        unrealized_taxable_gain = misc.dsum(
-            tre.taxable_gain_in_fiat for tre in unrealized_report_entries
-        )
+        for taxation_type, taxable_gain in taxable_gains.items():
+            eval_str += f"{taxation_type}: {taxable_gain:.2f} {config.FIAT}\n"
 
         if config.CALCULATE_UNREALIZED_GAINS:
             eval_str += (
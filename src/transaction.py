@@ -50,7 +50,8 @@ class Operation:
 
     @property
     def remark(self) -> str:
-        return ", ".join(self.remarks)
+        # Most operations have no remarks, skip joining an empty list.
+        return ", ".join(self.remarks) if self.remarks else ""
 
     @classmethod
     def type_name_c(cls) -> str:
@@ -219,6 +220,9 @@ class Withdrawal(Transaction):
 
 @dataclasses.dataclass
 class SoldCoin:
+    # Use slots to reduce the memory footprint of the (many) sold coins.
+    __slots__ = ("op", "sold")
+
     op: Operation
     sold: decimal.Decimal
 
@@ -275,16 +279,17 @@ class TaxReportEntry:
 
     @property
     def _gain_in_fiat(self) -> Optional[decimal.Decimal]:
+        total_fee_in_fiat = self._total_fee_in_fiat
         if (
             self.first_value_in_fiat is None
             and self.second_value_in_fiat is None
-            and self._total_fee_in_fiat is None
+            and total_fee_in_fiat is None
         ):
             return None
         gain_in_fiat = (
             misc.cdecimal(self.first_value_in_fiat)
             - misc.cdecimal(self.second_value_in_fiat)
-            - misc.cdecimal(self._total_fee_in_fiat)
+            - misc.cdecimal(total_fee_in_fiat)
         )
         if self.abs_gain_loss:
             gain_in_fiat = abs(gain_in_fiat)
@@ -294,11 +299,11 @@ class TaxReportEntry:
 
     @property
     def _taxable_gain_in_fiat(self) -> Optional[decimal.Decimal]:
-        if self.is_taxable and self._gain_in_fiat:
-            return self._gain_in_fiat
+        if self.is_taxable and (gain_in_fiat := self._gain_in_fiat):
+            return gain_in_fiat
         if self.get_excel_label("taxable_gain_in_fiat") == "-":
             return None
-        return decimal.Decimal()
+        return misc.DECIMAL_ZERO
 
     is_taxable: Optional[bool] = None
     taxation_type: Optional[str] = None
@@ -427,16 +432,16 @@ class TaxReportEntry:
                 yield field, width, hidden
 
     def excel_values(self) -> Iterator:
-        for field_name in self.field_names():
-            if self.is_excel_label(field_name):
-                value = getattr(self, field_name)
-                label = self.get_excel_label(field_name)
-                if label == "-":
-                    yield None
-                else:
-                    if isinstance(value, datetime.datetime):
-                        value = value.astimezone(config.LOCAL_TIMEZONE)
-                    yield value
+        # Pair labels and fields once per entry instead of searching the label
+        # of every field with `get_excel_label`.
+        for label, field in zip(self.excel_labels(), self.excel_fields()):
+            if label == "-":
+                yield None
+            else:
+                value = getattr(self, field.name)
+                if isinstance(value, datetime.datetime):
+                    value = value.astimezone(config.LOCAL_TIMEZONE)
+                yield value
 
 
 # Bypass dataclass machinery, add a custom property function to a dataclass field.